@@ -2,11 +2,218 @@
 Simple Streamlit terminal with one input field and two navigation buttons.
 """
 import streamlit as st
+import streamlit.components.v1 as components
 import os
+import re
+import html
+from collections import deque
+from functools import lru_cache
 from terminal_backend import CommandExecutor
 from utils.history import CommandHistory
 from utils.helpers import get_home_directory
-from nlp.interpreter import interpret_nl_query, is_nlp_command, extract_nlp_query
+
+
+# Maximum number of output entries kept in the terminal scrollback
+SCROLLBACK_LINES = 2000
+
+# Output classification in a single scan; "error" matches case-insensitively,
+# which also covers "Error:"
+OUTPUT_CLASS_RE = re.compile(r'(?P<error>(?i:error))|(?P<success>Success:|✓)')
+ERROR_RE = re.compile(r'error', re.IGNORECASE)
+
+# HTML wrapper for each kind of terminal output entry
+OUTPUT_TEMPLATES = {
+    "prompt": '<div>%s</div>',
+    "error": '<div class="error">%s</div>',
+    "success": '<div class="success">%s</div>',
+    "output": '<div>%s</div>',
+}
+
+# Simple Terminal CSS. Kept as a constant so it is built once at import; it is
+# still emitted on every run because Streamlit drops elements a rerun skips.
+TERMINAL_CSS = """
+<style>
+/* Hide Streamlit elements */
+#MainMenu {visibility: hidden;}
+footer {visibility: hidden;}
+header {visibility: hidden;}
+
+/* Terminal styling */
+.stApp {
+    background: #000000;
+    color: #ffffff;
+}
+
+ .main .block-container {
+     padding: 20px;
+     max-width: 100%;
+}
+
+/* Terminal output area */
+.terminal-output {
+    background: #000000;
+    color: #ffffff;
+    border: 1px solid #333;
+    border-radius: 5px;
+    padding: 15px;
+    font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
+    font-size: 14px;
+    line-height: 1.4;
+    min-height: 400px;
+    max-height: 500px;
+    overflow-y: auto;
+    white-space: pre-wrap;
+    margin-bottom: 20px;
+}
+
+.terminal-output .prompt {
+    color: #00ff00;
+    font-weight: bold;
+}
+
+.terminal-output .command {
+    color: #00ff00;
+}
+
+.terminal-output .error {
+    color: #ff6b6b;
+}
+
+.terminal-output .success {
+    color: #51cf66;
+}
+
+/* Input area */
+.input-area {
+    display: flex;
+    align-items: center;
+    gap: 0px;
+    margin-bottom: 10px;
+}
+
+.terminal-prompt {
+    color: #00ff00;
+    font-weight: bold;
+    font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
+    font-size: 14px;
+    white-space: nowrap;
+    margin-right: 0px;
+}
+
+/* Input field styling */
+.stTextInput > div > div > input {
+    background: #000000 !important;
+    color: #00ff00 !important;
+    border: 1px solid #333 !important;
+    font-family: 'Consolas', 'Monaco', 'Courier New', monospace !important;
+    font-size: 14px !important;
+    padding: 8px !important;
+    border-radius: 3px !important;
+    caret-color: #00ff00 !important;
+    margin-left: 0px !important;
+}
+
+.stTextInput > div > div > input:focus {
+    border-color: #00ff00 !important;
+    box-shadow: 0 0 5px rgba(0, 255, 0, 0.3) !important;
+}
+
+/* Button styling */
+.stButton > button {
+    background: #2d2d2d !important;
+    color: #00ff00 !important;
+    border: 1px solid #444 !important;
+    font-family: 'Consolas', 'Monaco', 'Courier New', monospace !important;
+    font-size: 12px !important;
+    padding: 6px 12px !important;
+    border-radius: 3px !important;
+    transition: all 0.2s !important;
+}
+
+.stButton > button:hover {
+    background: #3d3d3d !important;
+    border-color: #00ff00 !important;
+}
+
+/* Welcome message */
+.welcome-message {
+    color: #ffffff;
+    font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
+    line-height: 1.4;
+    margin-bottom: 20px;
+}
+
+.welcome-message .title {
+    color: #ffffff;
+    font-weight: bold;
+}
+</style>
+"""
+
+# Welcome message shown until the first command produces output
+WELCOME_HTML = """
+<div class="welcome-message">
+<span class="title">🚀 Simple Python Terminal with NLP</span><br><br>
+• Type commands and press Enter to execute<br>
+• Use ↑/↓ buttons to navigate command history<br>
+• Try 'help' for available commands<br>
+• Try '!nlp show me the files' for NLP features<br>
+</div>
+"""
+
+# Focuses the command input and binds its key handler. A single
+# MutationObserver is registered on the parent page and binds each command
+# input node as Streamlit mounts it; the WeakSet keeps a node from being bound
+# twice, and the window flag keeps a remounted component from adding a second
+# observer.
+TERMINAL_SCRIPT = """
+<script>
+const win = window.parent;
+const selector = 'input[aria-label="Command Input"]';
+
+if (!win.terminalInputObserver) {
+    const boundInputs = new WeakSet();
+
+    const bindInput = function(input) {
+        if (boundInputs.has(input)) {
+            return;
+        }
+        boundInputs.add(input);
+        input.focus();
+        input.addEventListener('keydown', function(e) {
+            if (e.key === 'Enter') {
+                // Enter submits the command form, whose callback runs it
+                return true;
+            }
+        });
+    };
+
+    const findInput = function(node) {
+        if (node.nodeType !== Node.ELEMENT_NODE) {
+            return null;
+        }
+        return node.matches(selector) ? node : node.querySelector(selector);
+    };
+
+    win.terminalInputObserver = new win.MutationObserver(function(mutations) {
+        for (const mutation of mutations) {
+            for (const node of mutation.addedNodes) {
+                const input = findInput(node);
+                if (input) {
+                    bindInput(input);
+                }
+            }
+        }
+    });
+    win.terminalInputObserver.observe(win.document.body, {childList: true, subtree: true});
+
+    const input = win.document.querySelector(selector);
+    if (input) {
+        bindInput(input);
+    }
+}
+</script>
+"""
 
 
 def initialize_session_state():
@@ -18,7 +225,7 @@ def initialize_session_state():
         st.session_state.command_history = CommandHistory()
 
     if 'terminal_output' not in st.session_state:
-        st.session_state.terminal_output = []
+        st.session_state.terminal_output = deque(maxlen=SCROLLBACK_LINES)
 
     if 'current_input' not in st.session_state:
         st.session_state.current_input = ""
@@ -26,7 +233,22 @@ def initialize_session_state():
     if 'show_welcome' not in st.session_state:
         st.session_state.show_welcome = True
 
+    if 'session_ended' not in st.session_state:
+        st.session_state.session_ended = False
+
+    if 'executor' not in st.session_state:
+        st.session_state.executor = CommandExecutor()
+
+    if 'output_body' not in st.session_state:
+        st.session_state.output_body = ""
+        st.session_state.last_block_len = 0
+
+    if 'last_output' not in st.session_state:
+        st.session_state.last_output = None
+        st.session_state.output_repeat = 0
 
+
+@lru_cache(maxsize=128)
 def get_prompt(cwd: str) -> str:
     """Generate the terminal prompt."""
     # Always show the actual current directory path
@@ -34,18 +256,97 @@ def get_prompt(cwd: str) -> str:
     return f"{display_path}$"
 
 
+def classify_output(text: str) -> str:
+    """
+    Pick the display kind for a terminal output entry.
+
+    Args:
+        text (str): Output entry text
+
+    Returns:
+        str: "error", "success" or "output"
+    """
+    match = OUTPUT_CLASS_RE.search(text)
+    if match is None:
+        return "output"
+    if match.lastgroup == "error":
+        return "error"
+    # An error marker later in the text still takes priority over success
+    if ERROR_RE.search(text, match.end()):
+        return "error"
+    return "success"
+
+
+def append_output_entry(kind: str, line: str):
+    """
+    Store a (kind, html) entry in the terminal output.
+
+    Consecutive identical output entries are collapsed into the last one
+    with a repeat count instead of being stored again; prompt echoes are
+    always kept, so each command run stays visible. The rendered output body is
+    updated in place: only the new (or rewritten) block is rendered, and the
+    oldest block is trimmed when the scrollback is full.
+    """
+    output = st.session_state.terminal_output
+    body = st.session_state.output_body
+
+    if output and kind != "prompt" and (kind, line) == st.session_state.last_output:
+        st.session_state.output_repeat += 1
+        entry = (kind, f"{line}  ×{st.session_state.output_repeat}")
+        output[-1] = entry
+        body = body[:len(body) - st.session_state.last_block_len]
+    else:
+        if len(output) == output.maxlen:
+            evicted_kind, evicted_line = output[0]
+            body = body[len(OUTPUT_TEMPLATES[evicted_kind] % evicted_line):]
+        entry = (kind, line)
+        output.append(entry)
+        st.session_state.last_output = entry
+        st.session_state.output_repeat = 1
+
+    block = OUTPUT_TEMPLATES[entry[0]] % entry[1]
+    st.session_state.output_body = body + block
+    st.session_state.last_block_len = len(block)
+
+
 def add_to_output(text: str):
-    """Add text to terminal output."""
+    """Add text to terminal output, escaped and classified once at write time."""
     if text and text != "CLEAR_TERMINAL":
-        st.session_state.terminal_output.append(text)
+        line = html.escape(text).replace("\n", "<br>")
+        append_output_entry(classify_output(line), line)
+
+
+def add_prompt_to_output(prompt: str, command: str):
+    """Echo a prompt and command, stored pre-split so it is never re-parsed."""
+    append_output_entry(
+        "prompt",
+        f'<span class="prompt">{html.escape(prompt)}</span>'
+        f'<span class="command"> {html.escape(command)}</span>')
 
 
 def clear_terminal():
     """Clear terminal output."""
-    st.session_state.terminal_output = []
+    st.session_state.terminal_output.clear()
+    st.session_state.output_body = ""
+    st.session_state.last_block_len = 0
+    st.session_state.last_output = None
+    st.session_state.output_repeat = 0
     st.session_state.show_welcome = False
 
 
+def render_terminal_output() -> str:
+    """
+    Build the HTML for the whole terminal output area.
+
+    The body is maintained incrementally by append_output_entry, so no
+    stored entry is rendered again here.
+
+    Returns:
+        str: Terminal output wrapped in a single container div
+    """
+    return f'<div class="terminal-output">{st.session_state.output_body}</div>'
+
+
 def handle_command(command: str):
     """Handle command execution."""
     if not command.strip():
@@ -55,23 +356,14 @@ def handle_command(command: str):
     st.session_state.command_history.add_command(command)
 
     # Add command to output
-    add_to_output(f"{get_prompt(st.session_state.cwd)} {command}")
+    add_prompt_to_output(get_prompt(st.session_state.cwd), command)
 
-    # Enhanced NLP processing
-    if is_nlp_command(command):
-        nlp_query = extract_nlp_query(command)
-        interpreted_command = interpret_nl_query(nlp_query)
-        add_to_output(f"NLP: {interpreted_command}")
+    # Execute the command, interpreting natural language if needed
+    output, new_cwd, should_continue, interpreted_command = st.session_state.executor.execute(
+        command, st.session_state.cwd)
 
-        # Execute the interpreted command
-        executor = CommandExecutor()
-        output, new_cwd, should_continue = executor.execute_command(
-            interpreted_command, st.session_state.cwd)
-    else:
-        # Regular command execution
-        executor = CommandExecutor()
-        output, new_cwd, should_continue = executor.execute_command(
-            command, st.session_state.cwd)
+    if interpreted_command is not None:
+        add_to_output(f"NLP: {interpreted_command}")
 
     # Update working directory if changed
     if new_cwd != st.session_state.cwd:
@@ -84,10 +376,30 @@ def handle_command(command: str):
         else:
             add_to_output(output)
 
-    # Check if should exit
+    # Check if should exit; main() stops rendering once the session has ended
     if not should_continue:
-        st.session_state.terminal_output.append("Terminal session ended.")
-        st.stop()
+        add_to_output("Terminal session ended.")
+        st.session_state.session_ended = True
+
+
+def handle_submit():
+    """Handle a command form submission: run the command and clear the field."""
+    command = st.session_state.command_input
+    st.session_state.current_input = ""
+    handle_command(command)
+
+
+def handle_clear():
+    """Handle the Clear button: wipe the output and the pending input."""
+    clear_terminal()
+    st.session_state.current_input = ""
+    st.session_state.session_ended = False
+
+
+def handle_new_session():
+    """Handle the New Session button shown after exit: accept commands again."""
+    st.session_state.session_ended = False
+    st.session_state.current_input = ""
 
 
 def handle_history_navigation(direction: str):
@@ -117,225 +429,68 @@ def main():
     initialize_session_state()
 
     # Simple Terminal CSS
-    st.markdown("""
-    <style>
-    /* Hide Streamlit elements */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    header {visibility: hidden;}
-    
-    /* Terminal styling */
-    .stApp {
-        background: #000000;
-        color: #ffffff;
-    }
-    
-     .main .block-container {
-         padding: 20px;
-         max-width: 100%;
-    }
-    
-    /* Terminal output area */
-    .terminal-output {
-        background: #000000;
-        color: #ffffff;
-        border: 1px solid #333;
-        border-radius: 5px;
-        padding: 15px;
-        font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
-        font-size: 14px;
-        line-height: 1.4;
-        min-height: 400px;
-        max-height: 500px;
-        overflow-y: auto;
-        white-space: pre-wrap;
-        margin-bottom: 20px;
-    }
-    
-    .terminal-output .prompt {
-        color: #00ff00;
-        font-weight: bold;
-    }
-    
-    .terminal-output .command {
-        color: #00ff00;
-    }
-    
-    .terminal-output .error {
-        color: #ff6b6b;
-    }
-    
-    .terminal-output .success {
-        color: #51cf66;
-    }
-    
-    /* Input area */
-    .input-area {
-        display: flex;
-        align-items: center;
-        gap: 0px;
-        margin-bottom: 10px;
-    }
-    
-    .terminal-prompt {
-        color: #00ff00;
-        font-weight: bold;
-        font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
-        font-size: 14px;
-        white-space: nowrap;
-        margin-right: 0px;
-    }
-    
-    /* Input field styling */
-    .stTextInput > div > div > input {
-        background: #000000 !important;
-        color: #00ff00 !important;
-        border: 1px solid #333 !important;
-        font-family: 'Consolas', 'Monaco', 'Courier New', monospace !important;
-        font-size: 14px !important;
-        padding: 8px !important;
-        border-radius: 3px !important;
-        caret-color: #00ff00 !important;
-        margin-left: 0px !important;
-    }
-    
-    .stTextInput > div > div > input:focus {
-        border-color: #00ff00 !important;
-        box-shadow: 0 0 5px rgba(0, 255, 0, 0.3) !important;
-    }
-    
-    /* Button styling */
-    .stButton > button {
-        background: #2d2d2d !important;
-        color: #00ff00 !important;
-        border: 1px solid #444 !important;
-        font-family: 'Consolas', 'Monaco', 'Courier New', monospace !important;
-        font-size: 12px !important;
-        padding: 6px 12px !important;
-        border-radius: 3px !important;
-        transition: all 0.2s !important;
-    }
-    
-    .stButton > button:hover {
-        background: #3d3d3d !important;
-        border-color: #00ff00 !important;
-    }
-    
-    /* Welcome message */
-    .welcome-message {
-        color: #ffffff;
-        font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
-        line-height: 1.4;
-        margin-bottom: 20px;
-    }
-    
-    .welcome-message .title {
-        color: #ffffff;
-        font-weight: bold;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    st.markdown(TERMINAL_CSS, unsafe_allow_html=True)
 
     # Title
     st.title(" Python Terminal")
 
-    # Welcome message
-    if st.session_state.show_welcome and not st.session_state.terminal_output:
-        st.markdown("""
-        <div class="welcome-message">
-        <span class="title">🚀 Simple Python Terminal with NLP</span><br><br>
-        • Type commands and press Enter to execute<br>
-        • Use ↑/↓ buttons to navigate command history<br>
-        • Try 'help' for available commands<br>
-        • Try '!nlp show me the files' for NLP features<br>
-        </div>
-        """, unsafe_allow_html=True)
-
-    # Terminal output area
-   # st.markdown('<div class="terminal-output">', unsafe_allow_html=True)
-
-    # Display terminal output
-    for output in st.session_state.terminal_output:
-        if "Error:" in output or "error" in output.lower():
-            st.markdown(
-                f'<div class="error">{output}</div>', unsafe_allow_html=True)
-        elif "Success:" in output or "✓" in output:
-            st.markdown(
-                f'<div class="success">{output}</div>', unsafe_allow_html=True)
-        elif output.startswith("user@"):
-            # Extract the current directory from the prompt and show it properly
-            prompt_part = output.split("$")[0] + "$"
-            command_part = output.split("$")[1] if "$" in output else ""
-            st.markdown(
-                f'<div><span class="prompt">{prompt_part}</span><span class="command">{command_part}</span></div>', unsafe_allow_html=True)
-        else:
-            st.markdown(f'<div>{output}</div>', unsafe_allow_html=True)
-
-    st.markdown('</div>', unsafe_allow_html=True)
+    # Welcome message and terminal output are never shown together, so they
+    # share a single placeholder element
+    output_slot = st.empty()
 
-    # Input area with prompt and text input
-    col1, col2 = st.columns([1, 4])
+    if st.session_state.terminal_output:
+        output_slot.markdown(render_terminal_output(), unsafe_allow_html=True)
+    elif st.session_state.show_welcome:
+        output_slot.markdown(WELCOME_HTML, unsafe_allow_html=True)
 
-    with col1:
-        st.markdown(f'<div class="terminal-prompt">{get_prompt(st.session_state.cwd)}</div>',
-                    unsafe_allow_html=True)
+    # After exit only a way back is offered; the input stays hidden until the
+    # user starts a new session
+    if st.session_state.session_ended:
+        st.button("New Session", key="new_session_btn", on_click=handle_new_session)
+        st.stop()
 
-    with col2:
-        command_input = st.text_input(
-            "Command Input",
-            value=st.session_state.current_input,
-            placeholder="Type command here...",
-            key="command_input",
-            label_visibility="collapsed"
-        )
+    # Input area with prompt and text input. Enter inside a form always
+    # submits, so a command recalled from history runs without being edited;
+    # the submit callback runs before the output above is drawn, so the
+    # result shows up without an extra rerun
+    with st.form("command_form", clear_on_submit=True):
+        col1, col2, col3 = st.columns([1, 4, 1])
+
+        with col1:
+            st.markdown(f'<div class="terminal-prompt">{get_prompt(st.session_state.cwd)}</div>',
+                        unsafe_allow_html=True)
+
+        with col2:
+            st.text_input(
+                "Command Input",
+                value=st.session_state.current_input,
+                placeholder="Type command here...",
+                key="command_input",
+                label_visibility="collapsed"
+            )
+
+        with col3:
+            st.form_submit_button("Run", on_click=handle_submit)
 
     # Navigation buttons
     col1, col2, col3 = st.columns([1, 1, 1])
 
+    # Buttons act through click callbacks, so their state changes are already
+    # applied when Streamlit reruns the script after the click
     with col1:
-        if st.button("Previous Command", key="prev_btn"):
-            handle_history_navigation("up")
-            st.rerun()
+        st.button("Previous Command", key="prev_btn",
+                  on_click=handle_history_navigation, args=("up",))
 
     with col2:
-        if st.button(" Forward Comamnd", key="next_btn"):
-            handle_history_navigation("down")
-            st.rerun()
+        st.button(" Forward Comamnd", key="next_btn",
+                  on_click=handle_history_navigation, args=("down",))
 
     with col3:
-        if st.button("Clear", key="clear_btn"):
-            clear_terminal()
-            st.session_state.current_input = ""
-            st.rerun()
-
-    # Handle Enter key press
-    if command_input:
-        # Check if this is a new command (not from history navigation)
-        if command_input != st.session_state.get('last_command', ''):
-            handle_command(command_input)
-            st.session_state.current_input = ""
-            st.session_state.last_command = command_input
-            st.rerun()
-
-    # JavaScript for Enter key handling
-    st.markdown("""
-    <script>
-    document.addEventListener('DOMContentLoaded', function() {
-        const input = document.querySelector('input[aria-label="Command Input"]');
-        if (input) {
-            input.focus();
-            
-            input.addEventListener('keydown', function(e) {
-                if (e.key === 'Enter') {
-                    // The form will handle the submission
-                    return true;
-                }
-            });
-        }
-    });
-    </script>
-    """, unsafe_allow_html=True)
+        st.button("Clear", key="clear_btn", on_click=handle_clear)
 
+    # JavaScript for Enter key handling (runs inside a zero-height component,
+    # since scripts passed to st.markdown are never executed)
+    components.html(TERMINAL_SCRIPT, height=0)
 
 if __name__ == "__main__":
     main()
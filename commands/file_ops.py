@@ -1,10 +1,28 @@
 """
 File and directory operations for the terminal.
 """
+import errno
 import os
 import shutil
+import stat
 from typing import List, Tuple
-from utils.helpers import normalize_path, is_safe_path, format_file_size, format_timestamp, get_file_permissions, is_safe_to_delete
+from utils.helpers import normalize_path, is_safe_path, format_file_size, format_timestamp, get_file_permissions, is_safe_to_delete, get_home_directory
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Linux ioctl that shares a file's data blocks with another file (reflink).
+# Only copy-on-write filesystems such as Btrfs and XFS support it.
+FICLONE = getattr(fcntl, 'FICLONE', 0x40049409) if fcntl and os.uname().sysname == 'Linux' else None
+
+# Errors meaning the filesystem cannot clone at all, as opposed to a
+# problem with one particular file
+CLONE_UNSUPPORTED_ERRNOS = frozenset({errno.EOPNOTSUPP, errno.ENOTTY, errno.EINVAL, errno.ENOSYS})
+
+# Devices (st_dev) whose filesystem rejected a clone; copies there skip it
+_NO_CLONE_DEVICES = set()
 
 
 def ls_command(cwd: str, args: List[str]) -> str:
@@ -39,52 +57,61 @@ def ls_command(cwd: str, args: List[str]) -> str:
         if not is_safe_path(target_path, cwd):
             return "Error: Access denied - path outside allowed directories"
 
-        if not os.path.exists(target_path):
+        try:
+            target_stat = os.stat(target_path)
+        except OSError:
             return f"Error: Directory '{target_dir}' not found"
 
-        if not os.path.isdir(target_path):
+        if not stat.S_ISDIR(target_stat.st_mode):
             return f"Error: '{target_dir}' is not a directory"
 
-        # Get directory contents
+        # Get directory contents; scandir entries carry the file type from
+        # readdir, so sorting and listing need no extra stat per entry
         try:
-            items = os.listdir(target_path)
+            with os.scandir(target_path) as it:
+                entries = list(it)
         except PermissionError:
             return f"Error: Permission denied accessing '{target_dir}'"
 
         # Filter hidden files if not showing all
         if not show_hidden:
-            items = [item for item in items if not item.startswith('.')]
+            entries = [entry for entry in entries if not entry.name.startswith('.')]
 
         # Sort items (directories first, then files)
-        items.sort(key=lambda x: (not os.path.isdir(
-            os.path.join(target_path, x)), x.lower()))
+        entries.sort(key=lambda e: (not e.is_dir(), e.name.lower()))
 
-        if not items:
+        if not entries:
             return f"Directory '{target_dir}' is empty"
 
         # Format output
         if long_format:
-            return _format_long_listing(items, target_path)
+            return _format_long_listing(entries)
         else:
-            return _format_simple_listing(items)
+            return _format_simple_listing([entry.name for entry in entries])
 
     except Exception as e:
         return f"Error listing directory: {str(e)}"
 
 
-def _format_long_listing(items: List[str], base_path: str) -> str:
+def _format_long_listing(entries: List[os.DirEntry]) -> str:
     """Format directory listing in long format."""
     lines = []
 
-    for item in items:
-        item_path = os.path.join(base_path, item)
+    for entry in entries:
+        item = entry.name
+        item_path = entry.path
         try:
-            stat_info = os.stat(item_path)
+            # DirEntry caches its stat results; only symlinks need a second
+            # stat to report their target's type and size
+            stat_info = entry.stat(follow_symlinks=False)
+            is_link = stat.S_ISLNK(stat_info.st_mode)
+            if is_link:
+                stat_info = entry.stat()
 
             # File type indicator
-            if os.path.isdir(item_path):
+            if stat.S_ISDIR(stat_info.st_mode):
                 file_type = '[DIR]'
-            elif os.path.islink(item_path):
+            elif is_link:
                 file_type = '[LINK]'
             else:
                 file_type = '[FILE]'
@@ -97,7 +124,7 @@ def _format_long_listing(items: List[str], base_path: str) -> str:
 
             # Name (with link target if symlink)
             name = item
-            if os.path.islink(item_path):
+            if is_link:
                 try:
                     link_target = os.readlink(item_path)
                     name = f"{item} -> {link_target}"
@@ -121,6 +148,59 @@ def _format_simple_listing(items: List[str]) -> str:
     return "\n".join(items)
 
 
+def _clone_or_copy(src: str, dst: str) -> str:
+    """
+    Copy a file, cloning its data blocks when the filesystem supports it.
+
+    Falls back to shutil.copy2 wherever cloning is unavailable, so the
+    result always matches copy2 (contents plus metadata). Filesystems that
+    reject the clone are remembered, so ext4 or tmpfs copies go straight
+    to copy2 after the first attempt.
+    """
+    if FICLONE is None:
+        return shutil.copy2(src, dst)
+
+    # Only regular files can be cloned; copy2 reports pipes, sockets and
+    # devices instead of blocking on them
+    src_stat = os.stat(src)
+    if not stat.S_ISREG(src_stat.st_mode) or src_stat.st_dev in _NO_CLONE_DEVICES:
+        return shutil.copy2(src, dst)
+
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+
+    try:
+        dst_stat = os.stat(dst)
+    except OSError:
+        dst_stat = None
+
+    if dst_stat is not None:
+        # Let copy2 deal with a special file in the destination's place
+        if not stat.S_ISREG(dst_stat.st_mode):
+            return shutil.copy2(src, dst)
+        # Opening dst for writing would truncate src if both are the same file
+        if os.path.samestat(src_stat, dst_stat):
+            raise shutil.SameFileError(f"'{src}' and '{dst}' are the same file")
+
+    # Clones cannot cross filesystems
+    try:
+        if os.stat(os.path.dirname(dst) or os.curdir).st_dev != src_stat.st_dev:
+            return shutil.copy2(src, dst)
+    except OSError:
+        return shutil.copy2(src, dst)
+
+    try:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+    except OSError as e:
+        if e.errno in CLONE_UNSUPPORTED_ERRNOS:
+            _NO_CLONE_DEVICES.add(src_stat.st_dev)
+        return shutil.copy2(src, dst)
+
+    shutil.copystat(src, dst)
+    return dst
+
+
 def cd_command(cwd: str, args: List[str]) -> Tuple[str, str]:
     """
     Change directory.
@@ -135,7 +215,7 @@ def cd_command(cwd: str, args: List[str]) -> Tuple[str, str]:
     try:
         if not args:
             # No arguments - go to home directory
-            new_cwd = os.path.expanduser("~")
+            new_cwd = get_home_directory()
         else:
             target_dir = args[0]
 
@@ -161,10 +241,12 @@ def cd_command(cwd: str, args: List[str]) -> Tuple[str, str]:
             else:
                 return "Error: Access denied - path outside allowed directories", cwd
 
-        if not os.path.exists(new_cwd):
+        try:
+            cwd_stat = os.stat(new_cwd)
+        except OSError:
             return f"Error: Directory '{target_dir}' not found", cwd
 
-        if not os.path.isdir(new_cwd):
+        if not stat.S_ISDIR(cwd_stat.st_mode):
             return f"Error: '{target_dir}' is not a directory", cwd
 
         # IMPORTANT: Don't change the actual working directory with os.chdir()
@@ -213,10 +295,14 @@ def mkdir_command(cwd: str, args: List[str]) -> str:
             if not is_safe_path(dir_path, cwd):
                 return f"Error: Access denied - path outside allowed directories"
 
-            if os.path.exists(dir_path):
+            # A plain mkdir covers the common case in one syscall; only
+            # nested paths with missing parents need makedirs
+            try:
+                os.mkdir(dir_path)
+            except FileExistsError:
                 return f"Error: Directory '{dir_name}' already exists"
-
-            os.makedirs(dir_path, exist_ok=False)
+            except FileNotFoundError:
+                os.makedirs(dir_path, exist_ok=False)
 
         return f"Created directory(ies): {', '.join(args)}"
 
@@ -265,7 +351,10 @@ def rm_command(cwd: str, args: List[str]) -> str:
             if not is_safe_path(item_path, cwd):
                 return f"Error: Access denied - path outside allowed directories"
 
-            if not os.path.exists(item_path):
+            # One stat answers both "does it exist" and "is it a directory"
+            try:
+                item_stat = os.stat(item_path)
+            except OSError:
                 return f"Error: '{item_name}' not found"
 
             # Enhanced safety check for Ubuntu system protection
@@ -278,7 +367,7 @@ def rm_command(cwd: str, args: List[str]) -> str:
                 return f"Error: Cannot remove system directory '{item_name}'"
 
             try:
-                if os.path.isdir(item_path):
+                if stat.S_ISDIR(item_stat.st_mode):
                     if recursive:
                         shutil.rmtree(item_path)
                         removed_items.append(f"directory '{item_name}'")
@@ -322,10 +411,12 @@ def rmdir_command(cwd: str, args: List[str]) -> str:
             if not is_safe_path(dir_path, cwd):
                 return f"Error: Access denied - path outside allowed directories"
 
-            if not os.path.exists(dir_path):
+            try:
+                dir_stat = os.stat(dir_path)
+            except OSError:
                 return f"Error: Directory '{dir_name}' not found"
 
-            if not os.path.isdir(dir_path):
+            if not stat.S_ISDIR(dir_stat.st_mode):
                 return f"Error: '{dir_name}' is not a directory"
 
             try:
@@ -414,17 +505,20 @@ def copy_command(cwd: str, args: List[str]) -> str:
         if not is_safe_path(source_path, cwd) or not is_safe_path(dest_path, cwd):
             return f"Error: Access denied - path outside allowed directories"
 
-        if not os.path.exists(source_path):
+        try:
+            source_stat = os.stat(source_path)
+        except OSError:
             return f"Error: Source '{source}' not found"
 
         try:
-            if os.path.isdir(source_path):
+            if stat.S_ISDIR(source_stat.st_mode):
                 # Copy directory
-                shutil.copytree(source_path, dest_path)
+                shutil.copytree(source_path, dest_path,
+                                copy_function=_clone_or_copy)
                 return f"Copied directory '{source}' to '{destination}'"
             else:
                 # Copy file
-                shutil.copy2(source_path, dest_path)
+                _clone_or_copy(source_path, dest_path)
                 return f"Copied file '{source}' to '{destination}'"
 
         except PermissionError:
@@ -527,7 +621,9 @@ def del_command(cwd: str, args: List[str]) -> str:
             if not is_safe_path(file_path, cwd):
                 return f"Error: Access denied - path outside allowed directories"
 
-            if not os.path.exists(file_path):
+            try:
+                file_stat = os.stat(file_path)
+            except OSError:
                 return f"Error: File '{file_name}' not found"
 
             # Enhanced safety check for Ubuntu system protection
@@ -535,7 +631,7 @@ def del_command(cwd: str, args: List[str]) -> str:
             if not is_safe:
                 return f"Error: Cannot delete '{file_name}' - {reason}"
 
-            if os.path.isdir(file_path):
+            if stat.S_ISDIR(file_stat.st_mode):
                 return f"Error: '{file_name}' is a directory (use rmdir for directories)"
 
             try:
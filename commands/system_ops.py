@@ -1,8 +1,36 @@
 """
 System monitoring operations using psutil.
 """
+import time
 import psutil
 from typing import List
+from utils.helpers import format_bytes
+
+# Usage bars are sliced from prebuilt strings instead of rebuilt per call
+BAR_LENGTH = 50
+BAR_FULL = "█" * BAR_LENGTH
+BAR_EMPTY = "░" * BAR_LENGTH
+
+# Back-to-back disk calls within this many seconds reuse the last I/O sample
+DISK_IO_TTL = 0.5
+
+# Last disk I/O sample as (monotonic timestamp, counters), used both as a
+# short-lived cache and as the baseline for read/write rates
+_last_disk_io = None
+
+
+def usage_bar(percent: float) -> str:
+    """
+    Render a usage percentage as a fixed-width bar.
+
+    Args:
+        percent (float): Usage percentage (0-100)
+
+    Returns:
+        str: Bar made of filled and empty block characters
+    """
+    used_bars = min(int((percent / 100) * BAR_LENGTH), BAR_LENGTH)
+    return BAR_FULL[:used_bars] + BAR_EMPTY[:BAR_LENGTH - used_bars]
 
 
 def cpu_command(args: List[str]) -> str:
@@ -16,14 +44,17 @@ def cpu_command(args: List[str]) -> str:
         str: Formatted CPU usage information
     """
     try:
-        # Get CPU usage
-        cpu_percent = psutil.cpu_percent(interval=1)
+        # Sample overall and per-CPU usage over the same one second window
+        # instead of blocking for a separate interval each
+        psutil.cpu_percent(interval=None)
+        psutil.cpu_percent(interval=None, percpu=True)
+        time.sleep(1)
+        cpu_percent = psutil.cpu_percent(interval=None)
+        per_cpu = psutil.cpu_percent(interval=None, percpu=True)
+
         cpu_count = psutil.cpu_count()
         cpu_freq = psutil.cpu_freq()
 
-        # Get per-CPU usage
-        per_cpu = psutil.cpu_percent(interval=1, percpu=True)
-
         # Get load average (Unix-like systems)
         try:
             load_avg = psutil.getloadavg()
@@ -71,14 +102,6 @@ def mem_command(args: List[str]) -> str:
         memory = psutil.virtual_memory()
         swap = psutil.swap_memory()
 
-        # Format memory sizes
-        def format_bytes(bytes_value):
-            for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-                if bytes_value < 1024.0:
-                    return f"{bytes_value:.1f} {unit}"
-                bytes_value /= 1024.0
-            return f"{bytes_value:.1f} PB"
-
         # Calculate percentages
         memory_used_percent = memory.percent
         swap_used_percent = swap.percent if swap.total > 0 else 0
@@ -106,11 +129,7 @@ def mem_command(args: List[str]) -> str:
         # Memory usage bar
         output.append("")
         output.append("Memory Usage Bar:")
-        bar_length = 50
-        used_bars = int((memory_used_percent / 100) * bar_length)
-        free_bars = bar_length - used_bars
-        bar = "█" * used_bars + "░" * free_bars
-        output.append(f"  [{bar}] {memory_used_percent:.1f}%")
+        output.append(f"  [{usage_bar(memory_used_percent)}] {memory_used_percent:.1f}%")
 
         return "\n".join(output)
 
@@ -139,13 +158,29 @@ def ps_command(args: List[str]) -> str:
             elif arg.isdigit():
                 max_processes = int(arg)
 
-        # Get all processes
+        # First pass seeds each process's CPU counter; psutil reports 0.0
+        # on a process's first cpu_percent() call
+        procs = []
+        for proc in psutil.process_iter(['pid', 'name', 'status']):
+            try:
+                proc.cpu_percent(None)
+            except (psutil.AccessDenied, psutil.ZombieProcess):
+                # Still listed, with the values as_dict() can read
+                pass
+            except psutil.NoSuchProcess:
+                continue
+            procs.append(proc)
+
+        time.sleep(0.1)
+
+        # Second pass reads CPU usage over the short interval
         processes = []
-        for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent', 'status']):
+        for proc in procs:
             try:
-                proc_info = proc.info
+                proc_info = dict(proc.info)
+                proc_info.update(proc.as_dict(['cpu_percent', 'memory_percent']))
                 processes.append(proc_info)
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
+            except psutil.NoSuchProcess:
                 continue
 
         # Sort by CPU usage (descending)
@@ -183,6 +218,25 @@ def ps_command(args: List[str]) -> str:
         return f"Error getting process information: {str(e)}"
 
 
+def _sample_disk_io():
+    """
+    Get disk I/O counters, reusing a sample taken within DISK_IO_TTL.
+
+    Returns:
+        tuple: (counters, previous sample or None when the cache was used)
+    """
+    global _last_disk_io
+
+    now = time.monotonic()
+    if _last_disk_io is not None and now - _last_disk_io[0] < DISK_IO_TTL:
+        return _last_disk_io[1], None
+
+    previous = _last_disk_io
+    disk_io = psutil.disk_io_counters()
+    _last_disk_io = (now, disk_io) if disk_io else None
+    return disk_io, previous
+
+
 def disk_command(args: List[str]) -> str:
     """
     Display disk usage information.
@@ -196,15 +250,7 @@ def disk_command(args: List[str]) -> str:
     try:
         # Get disk usage
         disk_usage = psutil.disk_usage('/')
-        disk_io = psutil.disk_io_counters()
-
-        # Format sizes
-        def format_bytes(bytes_value):
-            for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-                if bytes_value < 1024.0:
-                    return f"{bytes_value:.1f} {unit}"
-                bytes_value /= 1024.0
-            return f"{bytes_value:.1f} PB"
+        disk_io, previous_io = _sample_disk_io()
 
         # Calculate percentages
         used_percent = (disk_usage.used / disk_usage.total) * 100
@@ -222,11 +268,7 @@ def disk_command(args: List[str]) -> str:
         # Disk usage bar
         output.append("")
         output.append("Disk Usage Bar:")
-        bar_length = 50
-        used_bars = int((used_percent / 100) * bar_length)
-        free_bars = bar_length - used_bars
-        bar = "█" * used_bars + "░" * free_bars
-        output.append(f"[{bar}] {used_percent:.1f}%")
+        output.append(f"[{usage_bar(used_percent)}] {used_percent:.1f}%")
 
         if disk_io:
             output.append("")
@@ -236,6 +278,16 @@ def disk_command(args: List[str]) -> str:
             output.append(
                 f"  Writes: {disk_io.write_count} ({format_bytes(disk_io.write_bytes)})")
 
+            # Rates since the previous disk call
+            if previous_io:
+                elapsed = _last_disk_io[0] - previous_io[0]
+                read_rate = (disk_io.read_bytes - previous_io[1].read_bytes) / elapsed
+                write_rate = (disk_io.write_bytes - previous_io[1].write_bytes) / elapsed
+                output.append(
+                    f"  Read Rate: {format_bytes(max(read_rate, 0))}/s")
+                output.append(
+                    f"  Write Rate: {format_bytes(max(write_rate, 0))}/s")
+
         return "\n".join(output)
 
     except Exception as e:
@@ -3,9 +3,8 @@ Advanced NLP interpreter for natural language command translation.
 Implements multiple NLP techniques for robust command understanding.
 """
 import re
-import json
+from functools import lru_cache
 from typing import List, Dict, Tuple, Optional
-from datetime import datetime
 
 
 # Enhanced NLP Pattern Database with comprehensive keyword coverage
@@ -76,6 +75,38 @@ SYNONYM_MAPPINGS = {
     'move': ['rename', 'mv', 'relocate', 'transfer', 'shift', 'change location', 'reposition']
 }
 
+# Synonym -> base word, matched on whole words in a single pass. Longer
+# synonyms come first so "make a copy" wins over "make".
+SYNONYM_LOOKUP = {
+    synonym: base_word
+    for base_word, synonyms in SYNONYM_MAPPINGS.items()
+    for synonym in synonyms
+}
+SYNONYM_RE = re.compile(
+    r'\b(?:' + '|'.join(sorted(map(re.escape, SYNONYM_LOOKUP), key=len, reverse=True)) + r')\b'
+)
+
+# Known system commands, checked on every submitted command
+SYSTEM_COMMANDS = frozenset({
+    # Navigation commands
+    'ls', 'dir', 'cd', 'pwd', 'root',
+
+    # Directory operations
+    'mkdir', 'rmdir',
+
+    # File operations
+    'rm', 'del', 'touch', 'copy', 'cp', 'move', 'mv',
+
+    # System monitoring
+    'cpu', 'mem', 'ps', 'disk',
+
+    # Package management
+    'pip',
+
+    # Special commands
+    'help', 'clear', 'exit', 'quit'
+})
+
 # Intent Recognition Patterns
 INTENT_PATTERNS = {
     'file_management': r'\b(create|make|delete|remove|copy|move|rename|list|show)\b',
@@ -84,6 +115,225 @@ INTENT_PATTERNS = {
     'help': r'\b(help|commands|what|how|guide)\b'
 }
 
+# Entity extraction patterns, compiled once at import
+FILE_NAME_RE = re.compile(r'\b[a-zA-Z0-9._-]+\.\w+\b')
+DIRECTORY_NAME_RE = re.compile(r'\b[a-zA-Z0-9._-]+(?:/[a-zA-Z0-9._-]+)*\b')
+PATH_RE = re.compile(
+    r'["\']([^"\']+)["\']|([a-zA-Z]:\\[^\\s]+|[a-zA-Z0-9._-]+(?:/[a-zA-Z0-9._-]+)*)')
+NUMBER_RE = re.compile(r'\b\d+\b')
+FLAG_RE = re.compile(r'-\w+')
+
+# Step entity patterns used by extract_entity_from_step(_enhanced)
+DOUBLE_QUOTED_RE = re.compile(r'"([^"]*)"')
+SINGLE_QUOTED_RE = re.compile(r"'([^']*)'")
+NAMED_ENTITY_RES = [
+    re.compile(r'named\s+([a-zA-Z0-9._-]+)', re.IGNORECASE),
+    re.compile(r'called\s+([a-zA-Z0-9._-]+)', re.IGNORECASE),
+    re.compile(r'as\s+([a-zA-Z0-9._-]+)', re.IGNORECASE),
+    re.compile(r'with\s+name\s+([a-zA-Z0-9._-]+)', re.IGNORECASE)
+]
+ENHANCED_NAMED_ENTITY_RES = NAMED_ENTITY_RES + [
+    re.compile(r'the\s+([a-zA-Z0-9._-]+)', re.IGNORECASE),
+    re.compile(r'a\s+([a-zA-Z0-9._-]+)', re.IGNORECASE),
+    re.compile(r'an\s+([a-zA-Z0-9._-]+)', re.IGNORECASE)
+]
+FILE_WITH_EXTENSION_RE = re.compile(r'([a-zA-Z0-9._-]+\.[a-zA-Z0-9]+)')
+SEPARATED_PATH_RE = re.compile(r'([a-zA-Z0-9._-]+(?:[/\\][a-zA-Z0-9._-]+)+)')
+WORD_RE = re.compile(r'\b([a-zA-Z0-9_-]+)\b')
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton that finds every keyword occurring in a text.
+
+    A single pass over the text reports all keyword occurrences, including
+    overlapping ones, so callers can test many keyword groups against the
+    result instead of rescanning the text once per keyword.
+    """
+
+    def __init__(self, keywords):
+        # Build the keyword trie and the keywords ending at each state
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[set] = [set()]
+
+        for keyword in keywords:
+            state = 0
+            for char in keyword:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    outputs.append(set())
+                state = next_state
+            outputs[state].add(keyword)
+
+        # Fold the failure links into a full transition table, breadth-first
+        # so a state's failure target is always complete before the state
+        # itself. Scanning then takes one lookup per character; characters
+        # missing from a state's table lead back to the root.
+        fail = [0] * len(goto)
+        self.transitions: List[Dict[str, int]] = [None] * len(goto)
+        self.transitions[0] = dict(goto[0])
+        queue = list(goto[0].values())
+        for state in queue:
+            fallback = self.transitions[fail[state]]
+            self.transitions[state] = {**fallback, **goto[state]}
+            for char, next_state in goto[state].items():
+                fail[next_state] = fallback.get(char, 0)
+                outputs[next_state] |= outputs[fail[next_state]]
+                queue.append(next_state)
+
+        self.outputs: List[frozenset] = [frozenset(found) for found in outputs]
+
+    def find(self, text: str) -> frozenset:
+        """
+        Find the keywords that occur in a text.
+
+        Args:
+            text (str): Text to scan (matching is case-sensitive)
+
+        Returns:
+            frozenset: Keywords occurring anywhere in the text
+        """
+        transitions, outputs = self.transitions, self.outputs
+        found = set()
+        state = 0
+
+        for char in text:
+            state = transitions[state].get(char, 0)
+            if outputs[state]:
+                found |= outputs[state]
+
+        return frozenset(found)
+
+
+# Keyword groups tested against a query; a group matches when any of its
+# keywords occurs in the query
+CREATE_KEYWORDS = frozenset({'create', 'make', 'new'})
+FILE_KEYWORDS = frozenset({'file'})
+FOLDER_KEYWORDS = frozenset({'folder', 'directory', 'dir'})
+DELETE_KEYWORDS = frozenset({'delete', 'remove', 'rm', 'del', 'trash', 'erase', 'eliminate', 'destroy',
+                             'get rid of', 'clean up', 'purge', 'drop', 'kill', 'wipe', 'clear'})
+COPY_KEYWORDS = frozenset({'copy', 'cp', 'duplicate', 'replicate', 'backup', 'save as', 'make a copy'})
+MOVE_KEYWORDS = frozenset({'move', 'rename', 'mv', 'relocate', 'transfer', 'shift', 'change location',
+                           'reposition'})
+NAVIGATE_KEYWORDS = frozenset({'go to', 'navigate', 'change to', 'cd', 'switch', 'move to', 'browse to',
+                               'access', 'visit', 'enter'})
+LIST_KEYWORDS = frozenset({'list', 'show', 'display', 'files', 'view', 'see', 'ls', 'dir', 'directory',
+                           'folder', 'items', 'stuff', 'things', 'contents'})
+LIST_ALL_KEYWORDS = frozenset({'all', 'hidden', 'detailed', 'long', 'full', 'info', 'information',
+                               'complete', 'verbose'})
+LIST_DETAILED_KEYWORDS = frozenset({'detailed', 'long', 'full', 'info', 'information', 'complete',
+                                    'verbose'})
+LIST_HIDDEN_KEYWORDS = frozenset({'hidden', 'dot', 'all', 'including', 'with'})
+CPU_KEYWORDS = frozenset({'cpu', 'processor', 'performance', 'speed', 'usage', 'load', 'cores'})
+MEMORY_KEYWORDS = frozenset({'memory', 'ram', 'usage', 'mem', 'storage', 'available', 'free'})
+PROCESS_KEYWORDS = frozenset({'process', 'processes', 'running', 'task', 'ps', 'programs',
+                              'applications'})
+DISK_KEYWORDS = frozenset({'disk', 'space', 'storage', 'capacity', 'drive', 'volume', 'usage'})
+PWD_KEYWORDS = frozenset({'where', 'location', 'path', 'pwd', 'current directory', 'working directory'})
+HELP_KEYWORDS = frozenset({'help', 'commands', 'what can', 'guide', 'assistance'})
+CLEAR_KEYWORDS = frozenset({'clear', 'clean', 'reset', 'wipe'})
+EXIT_KEYWORDS = frozenset({'exit', 'quit', 'close', 'end', 'stop', 'terminate'})
+
+# Keyword groups that map straight to a fixed command, in priority order
+STATIC_COMMANDS = (
+    (CPU_KEYWORDS, 'cpu'),
+    (MEMORY_KEYWORDS, 'mem'),
+    (PROCESS_KEYWORDS, 'ps'),
+    (DISK_KEYWORDS, 'disk'),
+    (PWD_KEYWORDS, 'pwd'),
+    (HELP_KEYWORDS, 'help'),
+    (CLEAR_KEYWORDS, 'clear'),
+    (EXIT_KEYWORDS, 'exit'),
+)
+
+# Keyword groups for the individual steps of a multi-step command
+STEP_CREATE_KEYWORDS = frozenset({'create', 'make', 'new', 'add', 'build', 'generate', 'establish',
+                                  'set up', 'initialize'})
+STEP_FOLDER_KEYWORDS = frozenset({'folder', 'directory', 'dir', 'path', 'location'})
+STEP_FILE_KEYWORDS = frozenset({'file', 'document', 'text', 'script', 'program'})
+STEP_COPY_KEYWORDS = frozenset({'copy', 'duplicate', 'clone', 'cp', 'replicate', 'backup', 'save as',
+                                'make a copy'})
+STEP_TRANSFER_KEYWORDS = MOVE_KEYWORDS | STEP_COPY_KEYWORDS
+
+# Keyword groups for analyze_command_context
+URGENCY_KEYWORDS = frozenset({'urgent', 'quickly', 'fast', 'immediately', 'asap', 'hurry'})
+COMPLEXITY_KEYWORDS = frozenset({'and', 'then', 'after', 'before', 'also', 'next', 'followed by'})
+INTENT_KEYWORDS = (
+    ('create', frozenset({'create', 'make', 'new', 'add'})),
+    ('delete', frozenset({'delete', 'remove', 'trash', 'erase'})),
+    ('copy', frozenset({'copy', 'duplicate', 'clone'})),
+    ('move', frozenset({'move', 'rename', 'relocate'})),
+    ('list', frozenset({'show', 'list', 'display', 'view'})),
+    ('navigate', frozenset({'go', 'navigate', 'change', 'cd'}))
+)
+SOURCE_KEYWORDS = frozenset({'from', 'source'})
+DESTINATION_KEYWORDS = frozenset({'to', 'into', 'destination'})
+
+# Words that introduce the destination of a copy or move
+COPY_DESTINATION_WORDS = frozenset({'to', 'into', 'as', 'destination'})
+MOVE_DESTINATION_WORDS = frozenset({'to', 'as', 'destination'})
+
+# Words skipped when looking for an entity name after a keyword
+ENTITY_SKIP_WORDS = frozenset({'a', 'an', 'the', 'new'})
+
+# Words that are never taken as a file or folder name
+STEP_COMMON_WORDS = frozenset({
+    'a', 'an', 'the', 'new', 'create', 'make', 'delete', 'remove', 'copy', 'move',
+    'rename', 'file', 'folder', 'directory', 'dir', 'to', 'into', 'as', 'named', 'called', 'with', 'name'
+})
+ENHANCED_STEP_COMMON_WORDS = STEP_COMMON_WORDS | frozenset({
+    'trash', 'erase', 'eliminate', 'destroy', 'get', 'rid', 'of', 'clean', 'up', 'purge', 'drop',
+    'kill', 'wipe', 'clear', 'and', 'or', 'but', 'in', 'on', 'at', 'by', 'for', 'from', 'without'
+})
+
+# Navigation targets with a fixed cd argument
+HOME_TARGETS = frozenset({'home', '~'})
+ROOT_TARGETS = frozenset({'root', 'system', '/'})
+PARENT_TARGETS = frozenset({'up', 'back', '..'})
+
+# Words that split a query into source, destination and arguments
+DESTINATION_PREPOSITIONS = frozenset({'to', 'into', 'as'})
+SOURCE_PREPOSITIONS = frozenset({'from'})
+PREPOSITIONS = DESTINATION_PREPOSITIONS | SOURCE_PREPOSITIONS
+ARGUMENT_STOPWORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'with', 'in', 'on', 'at'})
+
+# Command pattern keywords, in COMMAND_PATTERNS order so the first match wins
+COMMAND_PATTERN_KEYWORDS = tuple(
+    (pattern_name, frozenset(pattern_data.get('keywords', [])))
+    for pattern_name, pattern_data in COMMAND_PATTERNS.items()
+)
+
+# Arguments that turn on ls flags when building a list command
+LIST_LONG_ARGUMENTS = frozenset({'all', 'detailed', 'long'})
+LIST_HIDDEN_ARGUMENTS = frozenset({'hidden', 'all'})
+
+# Default command for each pattern when no arguments could be parsed
+FALLBACK_COMMANDS = {
+    'list_files': 'ls',
+    'navigate': 'cd',
+    'create_directory': 'mkdir new_directory',
+    'create_file': 'touch new_file.txt',
+    'delete': 'rm',
+    'copy': 'copy',
+    'move': 'move',
+}
+
+# One automaton over every grouped keyword, so each query is scanned once
+KEYWORD_AUTOMATON = KeywordAutomaton(
+    CREATE_KEYWORDS | FILE_KEYWORDS | FOLDER_KEYWORDS | DELETE_KEYWORDS | COPY_KEYWORDS
+    | MOVE_KEYWORDS | NAVIGATE_KEYWORDS | LIST_KEYWORDS | LIST_ALL_KEYWORDS | LIST_DETAILED_KEYWORDS
+    | LIST_HIDDEN_KEYWORDS
+    | CPU_KEYWORDS | MEMORY_KEYWORDS | PROCESS_KEYWORDS | DISK_KEYWORDS | PWD_KEYWORDS
+    | HELP_KEYWORDS | CLEAR_KEYWORDS | EXIT_KEYWORDS | STEP_CREATE_KEYWORDS
+    | STEP_FOLDER_KEYWORDS | STEP_FILE_KEYWORDS | STEP_TRANSFER_KEYWORDS | URGENCY_KEYWORDS
+    | COMPLEXITY_KEYWORDS | SOURCE_KEYWORDS | DESTINATION_KEYWORDS
+    | frozenset().union(*(keywords for _, keywords in INTENT_KEYWORDS))
+    | frozenset().union(*(keywords for _, keywords in COMMAND_PATTERN_KEYWORDS))
+)
+
 
 def extract_entities(text: str) -> Dict[str, List[str]]:
     """Extract named entities from text using enhanced regex patterns."""
@@ -97,50 +347,41 @@ def extract_entities(text: str) -> Dict[str, List[str]]:
     }
 
     # Extract file names (with extensions) - more comprehensive pattern
-    file_pattern = r'\b[a-zA-Z0-9._-]+\.\w+\b'
-    entities['files'] = re.findall(file_pattern, text)
+    entities['files'] = FILE_NAME_RE.findall(text)
 
     # Extract directory names - improved pattern
-    dir_pattern = r'\b[a-zA-Z0-9._-]+(?:/[a-zA-Z0-9._-]+)*\b'
-    entities['directories'] = re.findall(dir_pattern, text)
+    entities['directories'] = DIRECTORY_NAME_RE.findall(text)
 
     # Extract full paths (including quoted paths)
-    path_pattern = r'["\']([^"\']+)["\']|([a-zA-Z]:\\[^\\s]+|[a-zA-Z0-9._-]+(?:/[a-zA-Z0-9._-]+)*)'
-    path_matches = re.findall(path_pattern, text)
+    path_matches = PATH_RE.findall(text)
     for match in path_matches:
         path = match[0] if match[0] else match[1]
         if path and ('/' in path or '\\' in path or '.' in path):
             entities['paths'].append(path)
 
     # Extract numbers
-    number_pattern = r'\b\d+\b'
-    entities['numbers'] = re.findall(number_pattern, text)
+    entities['numbers'] = NUMBER_RE.findall(text)
 
     # Extract flags
-    flag_pattern = r'-\w+'
-    entities['flags'] = re.findall(flag_pattern, text)
+    entities['flags'] = FLAG_RE.findall(text)
 
     return entities
 
 
+@lru_cache(maxsize=4096)
 def expand_synonyms(text: str) -> str:
     """Expand synonyms in text for better pattern matching."""
-    text_lower = text.lower()
-
-    for base_word, synonyms in SYNONYM_MAPPINGS.items():
-        for synonym in synonyms:
-            if synonym in text_lower:
-                # Replace synonym with base word for consistent matching
-                text_lower = text_lower.replace(synonym, base_word)
-
-    return text_lower
+    return SYNONYM_RE.sub(lambda match: SYNONYM_LOOKUP[match.group(0)], text.lower())
 
 
 def calculate_similarity(text1: str, text2: str) -> float:
     """Calculate enhanced similarity between two strings using synonym expansion."""
+    text1_lower = text1.lower()
+    text2_lower = text2.lower()
+
     # Expand synonyms in both texts
-    text1_expanded = expand_synonyms(text1.lower())
-    text2_expanded = expand_synonyms(text2.lower())
+    text1_expanded = expand_synonyms(text1_lower)
+    text2_expanded = expand_synonyms(text2_lower)
 
     words1 = set(text1_expanded.split())
     words2 = set(text2_expanded.split())
@@ -152,30 +393,57 @@ def calculate_similarity(text1: str, text2: str) -> float:
     union = words1.union(words2)
 
     # Boost score for exact matches
-    exact_match_boost = 0.2 if text1.lower() == text2.lower() else 0.0
+    exact_match_boost = 0.2 if text1_lower == text2_lower else 0.0
 
     return min(1.0, len(intersection) / len(union) + exact_match_boost)
 
 
-def get_best_match(query: str, patterns: Dict) -> Tuple[str, float]:
-    """Find the best matching pattern for a query."""
+# Command pattern keywords with their synonym-expanded word sets, so
+# matching a query only has to expand the query itself
+PATTERN_KEYWORD_WORDS = tuple(
+    (pattern_name, keyword.lower(), frozenset(expand_synonyms(keyword).split()))
+    for pattern_name, pattern_data in COMMAND_PATTERNS.items()
+    for keyword in pattern_data.get('keywords', [])
+)
+
+
+@lru_cache(maxsize=1024)
+def get_best_match(query: str) -> Tuple[str, float]:
+    """
+    Find the best matching command pattern for a query.
+
+    Scores are the same as calculate_similarity(query, keyword), with the
+    query expanded once rather than once per keyword.
+    """
     best_match = None
     best_score = 0.0
 
-    for pattern_name, pattern_data in patterns.items():
-        keywords = pattern_data.get('keywords', [])
-        for keyword in keywords:
-            score = calculate_similarity(query, keyword)
-            if score > best_score:
-                best_score = score
-                best_match = pattern_name
+    query_lower = query.lower()
+    query_words = set(expand_synonyms(query_lower).split())
+    if not query_words:
+        return best_match, best_score
+
+    for pattern_name, keyword, keyword_words in PATTERN_KEYWORD_WORDS:
+        common = len(query_words & keyword_words)
+        score = common / (len(query_words) + len(keyword_words) - common)
+
+        # Boost score for exact matches
+        if query_lower == keyword:
+            score = min(1.0, score + 0.2)
+
+        if score > best_score:
+            best_score = score
+            best_match = pattern_name
+            if best_score >= 1.0:
+                break
 
     return best_match, best_score
 
 
-def parse_command_structure(query: str) -> Dict:
+def parse_command_structure(query: str, query_lower: Optional[str] = None) -> Dict:
     """Parse the command structure from natural language."""
-    query_lower = query.lower()
+    if query_lower is None:
+        query_lower = query.lower()
     words = query.split()
 
     structure = {
@@ -188,23 +456,26 @@ def parse_command_structure(query: str) -> Dict:
     }
 
     # Extract action
-    for pattern_name, pattern_data in COMMAND_PATTERNS.items():
-        if any(keyword in query_lower for keyword in pattern_data.get('keywords', [])):
+    matched = KEYWORD_AUTOMATON.find(query_lower)
+    for pattern_name, keywords in COMMAND_PATTERN_KEYWORDS:
+        if matched & keywords:
             structure['action'] = pattern_name
             break
 
     # Extract targets and arguments
-    for i, word in enumerate(words):
-        if word.lower() in ['to', 'into', 'as', 'from']:
-            continue
-        elif i > 0 and words[i-1].lower() in ['to', 'into', 'as']:
+    previous = ''
+    for word, word_lower in zip(words, query_lower.split()):
+        if word_lower in PREPOSITIONS:
+            pass
+        elif previous in DESTINATION_PREPOSITIONS:
             structure['destination'] = word
-        elif i > 0 and words[i-1].lower() in ['from']:
+        elif previous in SOURCE_PREPOSITIONS:
             structure['source'] = word
         elif word.startswith('-'):
             structure['flags'].append(word)
-        elif word not in ['the', 'a', 'an', 'and', 'or', 'with', 'in', 'on', 'at']:
+        elif word not in ARGUMENT_STOPWORDS:
             structure['arguments'].append(word)
+        previous = word_lower
 
     return structure
 
@@ -218,9 +489,10 @@ def generate_command(structure: Dict) -> str:
 
     if action == 'list_files':
         cmd = 'ls'
-        if 'detailed' in structure['flags'] or any(word in str(structure['arguments']) for word in ['all', 'detailed', 'long']):
+        arguments = {argument.lower() for argument in structure['arguments']}
+        if 'detailed' in structure['flags'] or arguments & LIST_LONG_ARGUMENTS:
             cmd += ' -l'
-        if 'hidden' in structure['flags'] or any(word in str(structure['arguments']) for word in ['hidden', 'all']):
+        if 'hidden' in structure['flags'] or arguments & LIST_HIDDEN_ARGUMENTS:
             cmd += ' -a'
         if structure['target']:
             cmd += f' {structure["target"]}'
@@ -229,11 +501,12 @@ def generate_command(structure: Dict) -> str:
     elif action == 'navigate':
         cmd = 'cd'
         if structure['target']:
-            if structure['target'].lower() in ['home', '~']:
+            target = structure['target'].lower()
+            if target in HOME_TARGETS:
                 cmd += ' ~'
-            elif structure['target'].lower() in ['root', 'system', '/']:
+            elif target in ROOT_TARGETS:
                 cmd += ' /'
-            elif structure['target'].lower() in ['up', 'back', '..']:
+            elif target in PARENT_TARGETS:
                 cmd += ' ..'
             else:
                 cmd += f' {structure["target"]}'
@@ -284,40 +557,51 @@ def interpret_nl_query(query: str) -> str:
     if not query or not query.strip():
         return "echo 'Please provide a command'"
 
-    query = query.strip()
+    return _interpret_query(query.strip())
+
+
+@lru_cache(maxsize=512)
+def _interpret_query(query: str) -> str:
+    """
+    Interpret a stripped query.
+
+    Results are memoized on the stripped text, since the interpretation
+    depends only on it and users tend to repeat the same phrases.
+    """
     query_lower = query.lower()
 
     # Handle complex multi-step commands first
     if ' and ' in query_lower or ' then ' in query_lower or ' after that ' in query_lower:
-        return handle_multi_step_command(query)
+        return handle_multi_step_command(query, query_lower)
+
+    # Find every known keyword in one pass over the query
+    matched = KEYWORD_AUTOMATON.find(query_lower)
 
     # Handle single-step file/folder creation commands
-    if any(word in query_lower for word in ['create', 'make', 'new']):
-        if any(word in query_lower for word in ['file']):
+    if matched & CREATE_KEYWORDS:
+        if matched & FILE_KEYWORDS:
             # Extract file name
-            file_name = extract_entity_from_step(query, ['file'])
+            file_name = extract_entity_from_step(query, FILE_KEYWORDS)
             if file_name:
                 return f"touch {file_name}"
             else:
                 return "touch new_file.txt"
-        elif any(word in query_lower for word in ['folder', 'directory', 'dir']):
+        elif matched & FOLDER_KEYWORDS:
             # Extract folder name
-            folder_name = extract_entity_from_step(
-                query, ['folder', 'directory', 'dir'])
+            folder_name = extract_entity_from_step(query, FOLDER_KEYWORDS)
             if folder_name:
                 return f"mkdir {folder_name}"
             else:
                 return "mkdir new_folder"
 
     # Handle delete/remove commands with enhanced recognition
-    elif any(word in query_lower for word in ['delete', 'remove', 'rm', 'del', 'trash', 'erase', 'eliminate', 'destroy', 'get rid of', 'clean up', 'purge', 'drop', 'kill', 'wipe', 'clear']):
+    elif matched & DELETE_KEYWORDS:
         # Extract target name (file or folder) with better patterns
-        target = extract_entity_from_step_enhanced(query, ['delete', 'remove', 'rm', 'del', 'trash', 'erase',
-                                                   'eliminate', 'destroy', 'get rid of', 'clean up', 'purge', 'drop', 'kill', 'wipe', 'clear'])
+        target = extract_entity_from_step_enhanced(query, DELETE_KEYWORDS)
 
         if target:
             # Check if it's likely a directory (no extension, common directory words)
-            if not target.count('.') and any(word in query_lower for word in ['directory', 'folder', 'dir']):
+            if not target.count('.') and matched & FOLDER_KEYWORDS:
                 return f"rmdir {target}"
             else:
                 return f"rm {target}"
@@ -325,73 +609,53 @@ def interpret_nl_query(query: str) -> str:
             return "echo 'Please specify what to delete'"
 
     # Handle copy commands with enhanced recognition
-    elif any(word in query_lower for word in ['copy', 'cp', 'duplicate', 'replicate', 'backup', 'save as', 'make a copy']):
+    elif matched & COPY_KEYWORDS:
         # Extract source and destination with enhanced patterns
-        source = extract_entity_from_step_enhanced(
-            query, ['copy', 'cp', 'duplicate', 'replicate', 'backup', 'save as', 'make a copy'])
-        dest = extract_entity_from_step_enhanced(
-            query, ['to', 'into', 'as', 'destination'])
+        source = extract_entity_from_step_enhanced(query, COPY_KEYWORDS)
+        dest = extract_entity_from_step_enhanced(query, COPY_DESTINATION_WORDS)
         if source and dest:
             return f"copy {source} {dest}"
         else:
             return "echo 'Please specify source and destination for copy operation'"
 
     # Handle move/rename commands with enhanced recognition
-    elif any(word in query_lower for word in ['move', 'rename', 'mv', 'relocate', 'transfer', 'shift', 'change location', 'reposition']):
+    elif matched & MOVE_KEYWORDS:
         # Extract source and destination with enhanced patterns
-        source = extract_entity_from_step_enhanced(
-            query, ['move', 'rename', 'mv', 'relocate', 'transfer', 'shift', 'change location', 'reposition'])
-        dest = extract_entity_from_step_enhanced(
-            query, ['to', 'as', 'destination'])
+        source = extract_entity_from_step_enhanced(query, MOVE_KEYWORDS)
+        dest = extract_entity_from_step_enhanced(query, MOVE_DESTINATION_WORDS)
         if source and dest:
             return f"move {source} {dest}"
         else:
             return "echo 'Please specify source and destination for move operation'"
 
     # Handle navigation commands with enhanced recognition
-    elif any(word in query_lower for word in ['go to', 'navigate', 'change to', 'cd', 'switch', 'move to', 'browse to', 'access', 'visit', 'enter']):
+    elif matched & NAVIGATE_KEYWORDS:
         # Extract directory with enhanced patterns
-        directory = extract_entity_from_step_enhanced(
-            query, ['go to', 'navigate', 'change to', 'cd', 'switch', 'move to', 'browse to', 'access', 'visit', 'enter'])
+        directory = extract_entity_from_step_enhanced(query, NAVIGATE_KEYWORDS)
         if directory:
             return f"cd {directory}"
         else:
             return "cd"
 
     # Handle list commands with enhanced recognition
-    elif any(word in query_lower for word in ['list', 'show', 'display', 'files', 'view', 'see', 'ls', 'dir', 'directory', 'folder', 'items', 'stuff', 'things', 'contents']):
-        if any(word in query_lower for word in ['all', 'hidden', 'detailed', 'long', 'full', 'info', 'information', 'complete', 'verbose']):
+    elif matched & LIST_KEYWORDS:
+        if matched & LIST_ALL_KEYWORDS:
             return "ls -la"
-        elif any(word in query_lower for word in ['detailed', 'long', 'full', 'info', 'information', 'complete', 'verbose']):
+        elif matched & LIST_DETAILED_KEYWORDS:
             return "ls -l"
-        elif any(word in query_lower for word in ['hidden', 'dot', 'all', 'including', 'with']):
+        elif matched & LIST_HIDDEN_KEYWORDS:
             return "ls -a"
         else:
             return "ls"
 
-    # Enhanced system monitoring commands
-    elif any(word in query_lower for word in ['cpu', 'processor', 'performance', 'speed', 'usage', 'load', 'cores']):
-        return "cpu"
-    elif any(word in query_lower for word in ['memory', 'ram', 'usage', 'mem', 'storage', 'available', 'free']):
-        return "mem"
-    elif any(word in query_lower for word in ['process', 'processes', 'running', 'task', 'ps', 'programs', 'applications']):
-        return "ps"
-    elif any(word in query_lower for word in ['disk', 'space', 'storage', 'capacity', 'drive', 'volume', 'usage']):
-        return "disk"
-    elif any(word in query_lower for word in ['where', 'location', 'path', 'pwd', 'current directory', 'working directory']):
-        return "pwd"
-    elif any(word in query_lower for word in ['help', 'commands', 'what can', 'guide', 'assistance']):
-        return "help"
-    elif any(word in query_lower for word in ['clear', 'clean', 'reset', 'wipe']):
-        return "clear"
-    elif any(word in query_lower for word in ['exit', 'quit', 'close', 'end', 'stop', 'terminate']):
-        return "exit"
-
-    # Extract entities
-    entities = extract_entities(query)
+    # Enhanced system monitoring and session commands
+    else:
+        for keywords, static_command in STATIC_COMMANDS:
+            if matched & keywords:
+                return static_command
 
     # Parse command structure
-    structure = parse_command_structure(query)
+    structure = parse_command_structure(query, query_lower)
 
     # Generate command
     command = generate_command(structure)
@@ -400,44 +664,16 @@ def interpret_nl_query(query: str) -> str:
     if command == "echo 'Command not recognized'":
         # Try synonym expansion first
         expanded_query = expand_synonyms(query)
-        best_match, score = get_best_match(expanded_query, COMMAND_PATTERNS)
+        best_match, score = get_best_match(expanded_query)
 
         # Lower threshold for better recognition
-        if score > 0.2:  # Lowered threshold for fuzzy matching
-            if best_match == 'list_files':
-                return "ls"
-            elif best_match == 'navigate':
-                return "cd"
-            elif best_match == 'create_directory':
-                return "mkdir new_directory"
-            elif best_match == 'create_file':
-                return "touch new_file.txt"
-            elif best_match == 'delete':
-                return "rm"
-            elif best_match == 'copy':
-                return "copy"
-            elif best_match == 'move':
-                return "move"
+        if score > 0.2 and best_match in FALLBACK_COMMANDS:  # Lowered threshold for fuzzy matching
+            return FALLBACK_COMMANDS[best_match]
 
         # Try direct keyword matching as fallback
-        for pattern_name, pattern_data in COMMAND_PATTERNS.items():
-            keywords = pattern_data.get('keywords', [])
-            for keyword in keywords:
-                if keyword in query_lower:
-                    if pattern_name == 'list_files':
-                        return "ls"
-                    elif pattern_name == 'navigate':
-                        return "cd"
-                    elif pattern_name == 'create_directory':
-                        return "mkdir new_directory"
-                    elif pattern_name == 'create_file':
-                        return "touch new_file.txt"
-                    elif pattern_name == 'delete':
-                        return "rm"
-                    elif pattern_name == 'copy':
-                        return "copy"
-                    elif pattern_name == 'move':
-                        return "move"
+        for pattern_name, keywords in COMMAND_PATTERN_KEYWORDS:
+            if pattern_name in FALLBACK_COMMANDS and matched & keywords:
+                return FALLBACK_COMMANDS[pattern_name]
 
     return command if command != "echo 'Command not recognized'" else f"echo 'I didn't understand: \"{query}\". Try commands like: show files, delete folder, create file, go to directory, copy file, etc.'"
 
@@ -475,34 +711,12 @@ def is_system_command(command: str) -> bool:
     Returns:
         bool: True if it's a known system command
     """
-    if not command.strip():
+    # Get the first word (command name) without splitting the whole line
+    parts = command.split(None, 1)
+    if not parts:
         return False
 
-    # Get the first word (command name)
-    cmd = command.strip().split()[0].lower()
-
-    # List of known system commands
-    system_commands = {
-        # Navigation commands
-        'ls', 'dir', 'cd', 'pwd', 'root',
-
-        # Directory operations
-        'mkdir', 'rmdir',
-
-        # File operations
-        'rm', 'del', 'touch', 'copy', 'cp', 'move', 'mv',
-
-        # System monitoring
-        'cpu', 'mem', 'ps', 'disk',
-
-        # Package management
-        'pip',
-
-        # Special commands
-        'help', 'clear', 'exit', 'quit'
-    }
-
-    return cmd in system_commands
+    return parts[0].lower() in SYSTEM_COMMANDS
 
 
 def extract_nlp_query(command: str) -> str:
@@ -527,6 +741,32 @@ def extract_nlp_query(command: str) -> str:
     return command
 
 
+def parse_nlp_command(command: str) -> Optional[str]:
+    """
+    Detect an NLP command and extract its query in a single pass.
+
+    Equivalent to calling is_nlp_command() followed by extract_nlp_query(),
+    without stripping and scanning the command twice.
+
+    Args:
+        command (str): Command to check
+
+    Returns:
+        Optional[str]: Extracted query, or None if it's a system command
+    """
+    command = command.strip()
+
+    # Explicit !NLP prefix (backward compatibility)
+    if command.lower().startswith('!nlp'):
+        return command[5:].strip()  # Remove '!nlp' prefix
+
+    # Auto-detection: known system commands are not NLP
+    if is_system_command(command):
+        return None
+
+    return command
+
+
 def get_supported_patterns() -> list:
     """
     Get list of supported natural language patterns.
@@ -575,54 +815,47 @@ def analyze_command_context(query: str) -> Dict[str, any]:
         'is_multi_step': False
     }
 
+    # Find every known keyword in one pass over the query
+    matched = KEYWORD_AUTOMATON.find(query_lower)
+
     # Analyze urgency indicators
-    urgency_words = ['urgent', 'quickly',
-                     'fast', 'immediately', 'asap', 'hurry']
-    if any(word in query_lower for word in urgency_words):
+    if matched & URGENCY_KEYWORDS:
         context['urgency'] = 'high'
 
     # Analyze complexity
-    complexity_indicators = ['and', 'then', 'after',
-                             'before', 'also', 'next', 'followed by']
-    if any(word in query_lower for word in complexity_indicators):
+    if matched & COMPLEXITY_KEYWORDS:
         context['complexity'] = 'complex'
         context['is_multi_step'] = True
 
-    # Analyze intent
-    if any(word in query_lower for word in ['create', 'make', 'new', 'add']):
-        context['intent'] = 'create'
-    elif any(word in query_lower for word in ['delete', 'remove', 'trash', 'erase']):
-        context['intent'] = 'delete'
-    elif any(word in query_lower for word in ['copy', 'duplicate', 'clone']):
-        context['intent'] = 'copy'
-    elif any(word in query_lower for word in ['move', 'rename', 'relocate']):
-        context['intent'] = 'move'
-    elif any(word in query_lower for word in ['show', 'list', 'display', 'view']):
-        context['intent'] = 'list'
-    elif any(word in query_lower for word in ['go', 'navigate', 'change', 'cd']):
-        context['intent'] = 'navigate'
+    # Analyze intent (first matching intent wins)
+    for intent, keywords in INTENT_KEYWORDS:
+        if matched & keywords:
+            context['intent'] = intent
+            break
 
     # Analyze presence of targets, sources, destinations
-    entities = extract_entities(query)
-    context['has_target'] = len(entities['files']) > 0 or len(
-        entities['directories']) > 0
-    context['has_source'] = 'from' in query_lower or 'source' in query_lower
-    context['has_destination'] = 'to' in query_lower or 'into' in query_lower or 'destination' in query_lower
+    # Only presence matters, so stop at the first match
+    context['has_target'] = bool(FILE_NAME_RE.search(query) or DIRECTORY_NAME_RE.search(query))
+    context['has_source'] = bool(matched & SOURCE_KEYWORDS)
+    context['has_destination'] = bool(matched & DESTINATION_KEYWORDS)
 
     return context
 
 
-def handle_multi_step_command(query: str) -> str:
+def handle_multi_step_command(query: str, query_lower: Optional[str] = None) -> str:
     """
     Enhanced multi-step command handler with better pattern recognition.
 
     Args:
         query (str): Multi-step natural language query
+        query_lower (str, optional): query.lower(), if the caller already has it
 
     Returns:
         str: Combined commands to execute
     """
-    query_lower = query.lower().strip()
+    if query_lower is None:
+        query_lower = query.lower()
+    query_lower = query_lower.strip()
 
     # Enhanced connectors for better splitting
     connectors = [' and ', ' then ', ' after that ', ' next ', ' also ',
@@ -641,59 +874,58 @@ def handle_multi_step_command(query: str) -> str:
         if not step:
             continue
 
+        # Find every known keyword in one pass over the step
+        matched = KEYWORD_AUTOMATON.find(step)
+
         # Enhanced step analysis with better entity extraction
-        if any(word in step for word in ['create', 'make', 'new', 'add', 'build', 'generate', 'establish', 'set up', 'initialize']):
-            if any(word in step for word in ['folder', 'directory', 'dir', 'path', 'location']):
+        if matched & STEP_CREATE_KEYWORDS:
+            if matched & STEP_FOLDER_KEYWORDS:
                 # Extract folder name with enhanced extraction
                 folder_name = extract_entity_from_step_enhanced(
-                    step, ['folder', 'directory', 'dir', 'path', 'location'])
+                    step, STEP_FOLDER_KEYWORDS)
                 if folder_name:
                     commands.append(f"mkdir {folder_name}")
-            elif any(word in step for word in ['file', 'document', 'text', 'script', 'program']):
+            elif matched & STEP_FILE_KEYWORDS:
                 # Extract file name with enhanced extraction
                 file_name = extract_entity_from_step_enhanced(
-                    step, ['file', 'document', 'text', 'script', 'program'])
+                    step, STEP_FILE_KEYWORDS)
                 if file_name:
                     commands.append(f"touch {file_name}")
 
-        elif any(word in step for word in ['move', 'copy', 'rename', 'mv', 'relocate', 'transfer', 'shift', 'change location', 'reposition', 'duplicate', 'clone', 'cp', 'replicate', 'backup', 'save as', 'make a copy']):
+        elif matched & STEP_TRANSFER_KEYWORDS:
             # Extract source and destination with enhanced extraction
-            source = extract_entity_from_step_enhanced(step, ['move', 'copy', 'rename', 'mv', 'relocate', 'transfer', 'shift',
-                                                       'change location', 'reposition', 'duplicate', 'clone', 'cp', 'replicate', 'backup', 'save as', 'make a copy'])
-            dest = extract_entity_from_step_enhanced(
-                step, ['to', 'into', 'as', 'destination'])
+            source = extract_entity_from_step_enhanced(step, STEP_TRANSFER_KEYWORDS)
+            dest = extract_entity_from_step_enhanced(step, COPY_DESTINATION_WORDS)
 
             if source and dest:
-                if any(word in step for word in ['move', 'rename', 'mv', 'relocate', 'transfer', 'shift', 'change location', 'reposition']):
+                if matched & MOVE_KEYWORDS:
                     commands.append(f"move {source} {dest}")
-                elif any(word in step for word in ['copy', 'duplicate', 'clone', 'cp', 'replicate', 'backup', 'save as', 'make a copy']):
+                elif matched & STEP_COPY_KEYWORDS:
                     commands.append(f"copy {source} {dest}")
 
-        elif any(word in step for word in ['delete', 'remove', 'rm', 'del', 'trash', 'erase', 'eliminate', 'destroy', 'get rid of', 'clean up', 'purge', 'drop', 'kill', 'wipe', 'clear']):
+        elif matched & DELETE_KEYWORDS:
             # Extract target with enhanced extraction
-            target = extract_entity_from_step_enhanced(
-                step, ['delete', 'remove', 'rm', 'del', 'trash', 'erase', 'eliminate', 'destroy', 'get rid of', 'clean up', 'purge', 'drop', 'kill', 'wipe', 'clear'])
+            target = extract_entity_from_step_enhanced(step, DELETE_KEYWORDS)
             if target:
                 # Check if it's likely a directory
-                if not target.count('.') and any(word in step for word in ['directory', 'folder', 'dir']):
+                if not target.count('.') and matched & FOLDER_KEYWORDS:
                     commands.append(f"rmdir {target}")
                 else:
                     commands.append(f"rm {target}")
 
-        elif any(word in step for word in ['list', 'show', 'display', 'files', 'view', 'see', 'ls', 'dir', 'directory', 'folder', 'items', 'stuff', 'things', 'contents']):
-            if any(word in step for word in ['all', 'hidden', 'detailed', 'long', 'full', 'info', 'information', 'complete', 'verbose']):
+        elif matched & LIST_KEYWORDS:
+            if matched & LIST_ALL_KEYWORDS:
                 commands.append("ls -la")
-            elif any(word in step for word in ['detailed', 'long', 'full', 'info', 'information', 'complete', 'verbose']):
+            elif matched & LIST_DETAILED_KEYWORDS:
                 commands.append("ls -l")
-            elif any(word in step for word in ['hidden', 'dot', 'all', 'including', 'with']):
+            elif matched & LIST_HIDDEN_KEYWORDS:
                 commands.append("ls -a")
             else:
                 commands.append("ls")
 
-        elif any(word in step for word in ['go to', 'navigate', 'change to', 'cd', 'switch', 'move to', 'browse to', 'access', 'visit', 'enter']):
+        elif matched & NAVIGATE_KEYWORDS:
             # Extract directory with enhanced extraction
-            directory = extract_entity_from_step_enhanced(
-                step, ['go to', 'navigate', 'change to', 'cd', 'switch', 'move to', 'browse to', 'access', 'visit', 'enter'])
+            directory = extract_entity_from_step_enhanced(step, NAVIGATE_KEYWORDS)
             if directory:
                 commands.append(f"cd {directory}")
 
@@ -715,60 +947,48 @@ def extract_entity_from_step(step: str, keywords: List[str]) -> str:
     Returns:
         str: Extracted entity name
     """
-    import re
-
     # Try to find quoted names first
-    quoted = re.findall(r'"([^"]*)"', step)
+    quoted = DOUBLE_QUOTED_RE.findall(step)
     if quoted:
         return quoted[0]
 
-    quoted = re.findall(r"'([^']*)'", step)
+    quoted = SINGLE_QUOTED_RE.findall(step)
     if quoted:
         return quoted[0]
 
     # Look for patterns like "named X", "called X", "as X"
-    named_patterns = [
-        r'named\s+([a-zA-Z0-9._-]+)',
-        r'called\s+([a-zA-Z0-9._-]+)',
-        r'as\s+([a-zA-Z0-9._-]+)',
-        r'with\s+name\s+([a-zA-Z0-9._-]+)'
-    ]
-
-    for pattern in named_patterns:
-        match = re.search(pattern, step, re.IGNORECASE)
+    for pattern in NAMED_ENTITY_RES:
+        match = pattern.search(step)
         if match:
             return match.group(1)
 
     # Look for file extensions (.txt, .py, .js, etc.) - prioritize this
-    file_pattern = r'([a-zA-Z0-9._-]+\.[a-zA-Z0-9]+)'
-    file_match = re.search(file_pattern, step)
+    file_match = FILE_WITH_EXTENSION_RE.search(step)
     if file_match:
         return file_match.group(1)
 
     # Look for folder/directory names (no extension)
-    folder_pattern = r'\b([a-zA-Z0-9_-]+)\b'
-    folder_matches = re.findall(folder_pattern, step)
+    folder_matches = WORD_RE.findall(step)
     # Filter out common words and action words
-    common_words = {'a', 'an', 'the', 'new', 'create', 'make', 'delete', 'remove', 'copy', 'move',
-                    'rename', 'file', 'folder', 'directory', 'dir', 'to', 'into', 'as', 'named', 'called', 'with', 'name'}
     for match in folder_matches:
-        if match.lower() not in common_words and len(match) > 1:
+        if match.lower() not in STEP_COMMON_WORDS and len(match) > 1:
             return match
 
     # Fallback: look for words after keywords
     words = step.split()
-    for i, word in enumerate(words):
-        if word.lower() in keywords and i + 1 < len(words):
+    words_lower = step.lower().split()
+    for i, word_lower in enumerate(words_lower):
+        if word_lower in keywords and i + 1 < len(words):
             # Skip common words like "a", "the", "new"
-            next_word = words[i + 1].lower()
-            if next_word in ['a', 'an', 'the', 'new'] and i + 2 < len(words):
+            if words_lower[i + 1] in ENTITY_SKIP_WORDS and i + 2 < len(words):
                 entity = words[i + 2]
             else:
                 entity = words[i + 1]
             # Clean up the entity name
             entity = entity.strip('.,!?;:"')
+            entity_lower = entity.lower()
             # Don't return the action word itself as entity
-            if entity.lower() not in keywords:
+            if entity_lower not in keywords:
                 return entity
 
     return None
@@ -785,76 +1005,54 @@ def extract_entity_from_step_enhanced(step: str, keywords: List[str]) -> str:
     Returns:
         str: Extracted entity name
     """
-    import re
-
     # Try to find quoted names first (including paths)
-    quoted = re.findall(r'"([^"]*)"', step)
+    quoted = DOUBLE_QUOTED_RE.findall(step)
     if quoted:
         return quoted[0]
 
-    quoted = re.findall(r"'([^']*)'", step)
+    quoted = SINGLE_QUOTED_RE.findall(step)
     if quoted:
         return quoted[0]
 
     # Look for patterns like "named X", "called X", "as X", "the X"
-    named_patterns = [
-        r'named\s+([a-zA-Z0-9._-]+)',
-        r'called\s+([a-zA-Z0-9._-]+)',
-        r'as\s+([a-zA-Z0-9._-]+)',
-        r'with\s+name\s+([a-zA-Z0-9._-]+)',
-        r'the\s+([a-zA-Z0-9._-]+)',
-        r'a\s+([a-zA-Z0-9._-]+)',
-        r'an\s+([a-zA-Z0-9._-]+)'
-    ]
-
-    for pattern in named_patterns:
-        match = re.search(pattern, step, re.IGNORECASE)
+    for pattern in ENHANCED_NAMED_ENTITY_RES:
+        match = pattern.search(step)
         if match:
             return match.group(1)
 
     # Look for file extensions (.txt, .py, .js, etc.) - prioritize this
-    file_pattern = r'([a-zA-Z0-9._-]+\.[a-zA-Z0-9]+)'
-    file_match = re.search(file_pattern, step)
+    file_match = FILE_WITH_EXTENSION_RE.search(step)
     if file_match:
         return file_match.group(1)
 
     # Look for paths (with slashes or backslashes)
-    path_pattern = r'([a-zA-Z0-9._-]+(?:[/\\][a-zA-Z0-9._-]+)+)'
-    path_match = re.search(path_pattern, step)
+    path_match = SEPARATED_PATH_RE.search(step)
     if path_match:
         return path_match.group(1)
 
     # Look for folder/directory names (no extension)
-    folder_pattern = r'\b([a-zA-Z0-9_-]+)\b'
-    folder_matches = re.findall(folder_pattern, step)
+    folder_matches = WORD_RE.findall(step)
 
     # Enhanced common words filter
-    common_words = {
-        'a', 'an', 'the', 'new', 'create', 'make', 'delete', 'remove', 'copy', 'move',
-        'rename', 'file', 'folder', 'directory', 'dir', 'to', 'into', 'as', 'named',
-        'called', 'with', 'name', 'trash', 'erase', 'eliminate', 'destroy', 'get',
-        'rid', 'of', 'clean', 'up', 'purge', 'drop', 'kill', 'wipe', 'clear', 'and',
-        'or', 'but', 'in', 'on', 'at', 'by', 'for', 'from', 'with', 'without'
-    }
-
     for match in folder_matches:
-        if match.lower() not in common_words and len(match) > 1:
+        if match.lower() not in ENHANCED_STEP_COMMON_WORDS and len(match) > 1:
             return match
 
     # Enhanced fallback: look for words after keywords with better context
     words = step.split()
-    for i, word in enumerate(words):
-        if word.lower() in keywords and i + 1 < len(words):
+    words_lower = step.lower().split()
+    for i, word_lower in enumerate(words_lower):
+        if word_lower in keywords and i + 1 < len(words):
             # Skip common words like "a", "the", "new"
-            next_word = words[i + 1].lower()
-            if next_word in ['a', 'an', 'the', 'new'] and i + 2 < len(words):
+            if words_lower[i + 1] in ENTITY_SKIP_WORDS and i + 2 < len(words):
                 entity = words[i + 2]
             else:
                 entity = words[i + 1]
             # Clean up the entity name
             entity = entity.strip('.,!?;:"')
+            entity_lower = entity.lower()
             # Don't return the action word itself as entity
-            if entity.lower() not in keywords and entity.lower() not in common_words:
+            if entity_lower not in keywords and entity_lower not in ENHANCED_STEP_COMMON_WORDS:
                 return entity
 
     return None
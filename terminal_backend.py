@@ -12,7 +12,7 @@ from commands.file_ops import (
     cp_command, mv_command, del_command, dir_command
 )
 from commands.system_ops import cpu_command, mem_command, ps_command, disk_command
-from nlp.interpreter import interpret_nl_query, is_nlp_command, extract_nlp_query
+from nlp.interpreter import interpret_nl_query, is_nlp_command, parse_nlp_command
 
 
 class CommandExecutor:
@@ -54,13 +54,38 @@ class CommandExecutor:
             "quit": self._exit_command,
         }
 
-    def execute_command(self, command: str, cwd: str) -> Tuple[str, str, bool]:
+    def execute(self, command: str, cwd: str) -> Tuple[str, str, bool, Optional[str]]:
+        """
+        Execute raw terminal input, interpreting natural language if needed.
+
+        Args:
+            command (str): The raw command typed by the user
+            cwd (str): Current working directory
+
+        Returns:
+            Tuple[str, str, bool, Optional[str]]: (output, new_cwd, should_continue,
+                interpreted_command), where interpreted_command is None for
+                regular commands
+        """
+        nl_query = parse_nlp_command(command)
+        if nl_query is None:
+            return (*self.execute_command(command, cwd), None)
+
+        interpreted_command = interpret_nl_query(nl_query)
+        output, new_cwd, should_continue = self.execute_command(
+            interpreted_command, cwd, interpret_nlp=False)
+        return output, new_cwd, should_continue, interpreted_command
+
+    def execute_command(self, command: str, cwd: str, interpret_nlp: bool = True) -> Tuple[str, str, bool]:
         """
         Execute a command and return output, new cwd, and whether to continue.
 
         Args:
             command (str): The command to execute
             cwd (str): Current working directory
+            interpret_nlp (bool): Whether to treat non-system commands as NLP
+                queries. Disabled for commands that already came out of the
+                interpreter, so its replies are never interpreted again.
 
         Returns:
             Tuple[str, str, bool]: (output, new_cwd, should_continue)
@@ -70,15 +95,21 @@ class CommandExecutor:
             if not command.strip():
                 return "", cwd, True
 
+            # The interpreter answers queries it cannot run with an echo of
+            # a message; show the message rather than looking up "echo"
+            if not interpret_nlp and command.startswith("echo "):
+                return self._interpreter_message(command), cwd, True
+
             # Handle multi-step commands (separated by &&)
             if ' && ' in command:
                 return self.execute_multi_step_command(command, cwd)
 
             # Handle NLP commands
-            if is_nlp_command(command):
-                nl_query = extract_nlp_query(command)
-                translated_command = interpret_nl_query(nl_query)
-                return self.execute_command(translated_command, cwd)
+            if interpret_nlp:
+                nl_query = parse_nlp_command(command)
+                if nl_query is not None:
+                    translated_command = interpret_nl_query(nl_query)
+                    return self.execute_command(translated_command, cwd, interpret_nlp=False)
 
             # Parse command and arguments
             parts = command.strip().split()
@@ -166,6 +197,14 @@ class CommandExecutor:
         except Exception as e:
             return f"Error executing multi-step command: {str(e)}", cwd, True
 
+    @staticmethod
+    def _interpreter_message(command: str) -> str:
+        """Extract the message from an interpreter reply like "echo 'text'"."""
+        message = command[len("echo "):].strip()
+        if len(message) >= 2 and message[0] == message[-1] == "'":
+            message = message[1:-1]
+        return message
+
     def _root_command(self, args: list) -> Tuple[str, str]:
         """Change to root directory."""
         import os
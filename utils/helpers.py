@@ -3,14 +3,119 @@ Utility functions for cross-platform terminal operations.
 """
 import os
 import platform
+from functools import lru_cache
 from pathlib import Path
 
+# Size units in powers of 1024, indexed by floor(log1024(size))
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
 
+
+@lru_cache(maxsize=None)
 def get_home_directory():
-    """Get the user's home directory in a cross-platform way."""
+    """
+    Get the user's home directory in a cross-platform way.
+
+    The home directory does not change while the terminal runs, so the
+    lookup is done once and reused.
+    """
     return str(Path.home())
 
 
+@lru_cache(maxsize=None)
+def get_real_home_directory():
+    """Get the home directory with symlinks resolved, computed once."""
+    return os.path.realpath(get_home_directory())
+
+
+@lru_cache(maxsize=None)
+def get_critical_directories():
+    """
+    Get the critical system directories that exist on this machine.
+
+    System directories do not come and go while the terminal runs, so the
+    list is built and checked for existence once.
+
+    Returns:
+        tuple: Existing critical directory paths
+    """
+    system_root = os.path.abspath(os.sep)
+
+    critical_dirs = [
+        # Core system directories
+        os.path.join(system_root, 'boot'),
+        os.path.join(system_root, 'etc'),
+        os.path.join(system_root, 'bin'),
+        os.path.join(system_root, 'sbin'),
+        os.path.join(system_root, 'usr', 'bin'),
+        os.path.join(system_root, 'usr', 'sbin'),
+        os.path.join(system_root, 'usr', 'lib'),
+        os.path.join(system_root, 'usr', 'lib64'),
+        os.path.join(system_root, 'usr', 'lib32'),
+        os.path.join(system_root, 'lib'),
+        os.path.join(system_root, 'lib64'),
+        os.path.join(system_root, 'lib32'),
+
+        # System configuration
+        os.path.join(system_root, 'var', 'log'),
+        os.path.join(system_root, 'var', 'lib'),
+        os.path.join(system_root, 'var', 'cache'),
+        os.path.join(system_root, 'var', 'spool'),
+        os.path.join(system_root, 'var', 'run'),
+
+        # Kernel and drivers
+        os.path.join(system_root, 'lib', 'modules'),
+        os.path.join(system_root, 'lib', 'firmware'),
+
+        # System services
+        os.path.join(system_root, 'etc', 'systemd'),
+        os.path.join(system_root, 'etc', 'init.d'),
+        os.path.join(system_root, 'etc', 'rc.d'),
+
+        # Package management
+        os.path.join(system_root, 'var', 'lib', 'dpkg'),
+        os.path.join(system_root, 'var', 'lib', 'apt'),
+        os.path.join(system_root, 'etc', 'apt'),
+
+        # Network configuration
+        os.path.join(system_root, 'etc', 'network'),
+        os.path.join(system_root, 'etc', 'netplan'),
+
+        # Security
+        os.path.join(system_root, 'etc', 'ssh'),
+        os.path.join(system_root, 'etc', 'ssl'),
+        os.path.join(system_root, 'etc', 'pam.d'),
+
+        # Windows compatibility (if WSL)
+        os.path.join(system_root, 'Windows', 'System32'),
+        os.path.join(system_root, 'Windows', 'SysWOW64'),
+        os.path.join(system_root, 'Program Files'),
+        os.path.join(system_root, 'Program Files (x86)'),
+    ]
+
+    return tuple(d for d in critical_dirs if os.path.exists(d))
+
+
+@lru_cache(maxsize=None)
+def get_user_directories():
+    """
+    Get the common user directories that exist on this machine.
+
+    Returns:
+        tuple: Existing user directory paths
+    """
+    system_root = os.path.abspath(os.sep)
+
+    user_dirs = [
+        os.path.join(system_root, 'Users'),
+        os.path.join(system_root, 'home'),
+        os.path.join(system_root, 'tmp'),
+        os.path.join(system_root, 'temp'),
+    ]
+
+    return tuple(d for d in user_dirs if os.path.exists(d))
+
+
+@lru_cache(maxsize=256)
 def normalize_path(path, cwd):
     """
     Normalize a path relative to current working directory.
@@ -61,65 +166,12 @@ def is_safe_path(path, cwd):
             return False
 
         # Prevent operations on critical system directories (Ubuntu/Linux specific)
-        critical_dirs = [
-            # Core system directories
-            os.path.join(system_root, 'boot'),
-            os.path.join(system_root, 'etc'),
-            os.path.join(system_root, 'bin'),
-            os.path.join(system_root, 'sbin'),
-            os.path.join(system_root, 'usr', 'bin'),
-            os.path.join(system_root, 'usr', 'sbin'),
-            os.path.join(system_root, 'usr', 'lib'),
-            os.path.join(system_root, 'usr', 'lib64'),
-            os.path.join(system_root, 'usr', 'lib32'),
-            os.path.join(system_root, 'lib'),
-            os.path.join(system_root, 'lib64'),
-            os.path.join(system_root, 'lib32'),
-
-            # System configuration
-            os.path.join(system_root, 'var', 'log'),
-            os.path.join(system_root, 'var', 'lib'),
-            os.path.join(system_root, 'var', 'cache'),
-            os.path.join(system_root, 'var', 'spool'),
-            os.path.join(system_root, 'var', 'run'),
-
-            # Kernel and drivers
-            os.path.join(system_root, 'lib', 'modules'),
-            os.path.join(system_root, 'lib', 'firmware'),
-
-            # System services
-            os.path.join(system_root, 'etc', 'systemd'),
-            os.path.join(system_root, 'etc', 'init.d'),
-            os.path.join(system_root, 'etc', 'rc.d'),
-
-            # Package management
-            os.path.join(system_root, 'var', 'lib', 'dpkg'),
-            os.path.join(system_root, 'var', 'lib', 'apt'),
-            os.path.join(system_root, 'etc', 'apt'),
-
-            # Network configuration
-            os.path.join(system_root, 'etc', 'network'),
-            os.path.join(system_root, 'etc', 'netplan'),
-
-            # Security
-            os.path.join(system_root, 'etc', 'ssh'),
-            os.path.join(system_root, 'etc', 'ssl'),
-            os.path.join(system_root, 'etc', 'pam.d'),
-
-            # Windows compatibility (if WSL)
-            os.path.join(system_root, 'Windows', 'System32'),
-            os.path.join(system_root, 'Windows', 'SysWOW64'),
-            os.path.join(system_root, 'Program Files'),
-            os.path.join(system_root, 'Program Files (x86)'),
-        ]
-
-        for critical_dir in critical_dirs:
-            if os.path.exists(critical_dir) and real_path.startswith(critical_dir):
+        for critical_dir in get_critical_directories():
+            if real_path.startswith(critical_dir):
                 return False
 
         # Allow operations within user's home directory
-        home_dir = get_home_directory()
-        real_home = os.path.realpath(home_dir)
+        real_home = get_real_home_directory()
         if real_path.startswith(real_home):
             return True
 
@@ -128,15 +180,8 @@ def is_safe_path(path, cwd):
             return True
 
         # Allow operations in common user directories
-        user_dirs = [
-            os.path.join(system_root, 'Users'),
-            os.path.join(system_root, 'home'),
-            os.path.join(system_root, 'tmp'),
-            os.path.join(system_root, 'temp'),
-        ]
-
-        for user_dir in user_dirs:
-            if os.path.exists(user_dir) and real_path.startswith(user_dir):
+        for user_dir in get_user_directories():
+            if real_path.startswith(user_dir):
                 return True
 
         return False
@@ -144,6 +189,22 @@ def is_safe_path(path, cwd):
         return False
 
 
+def _size_unit_index(size_bytes, max_index):
+    """
+    Pick the SIZE_UNITS index for a byte count.
+
+    The unit follows from the bit length, so no division loop is needed.
+
+    Args:
+        size_bytes (int): Size in bytes
+        max_index (int): Largest unit index to use
+
+    Returns:
+        int: Index into SIZE_UNITS
+    """
+    return min(max((int(size_bytes).bit_length() - 1) // 10, 0), max_index)
+
+
 def format_file_size(size_bytes):
     """
     Format file size in human readable format.
@@ -157,13 +218,22 @@ def format_file_size(size_bytes):
     if size_bytes == 0:
         return "0B"
 
-    size_names = ["B", "KB", "MB", "GB", "TB"]
-    i = 0
-    while size_bytes >= 1024 and i < len(size_names) - 1:
-        size_bytes /= 1024.0
-        i += 1
+    i = _size_unit_index(size_bytes, 4)
+    return f"{size_bytes / (1 << (i * 10)):.1f}{SIZE_UNITS[i]}"
+
 
-    return f"{size_bytes:.1f}{size_names[i]}"
+def format_bytes(bytes_value):
+    """
+    Format a byte count with a spaced unit, as used by the system monitors.
+
+    Args:
+        bytes_value (int): Size in bytes
+
+    Returns:
+        str: Formatted size string (e.g., "1.5 GB")
+    """
+    i = _size_unit_index(bytes_value, 5)
+    return f"{bytes_value / (1 << (i * 10)):.1f} {SIZE_UNITS[i]}"
 
 
 def get_file_permissions(file_path):
@@ -18,8 +18,9 @@ class CommandHistory:
         Args:
             command (str): The command to add
         """
-        if command.strip() and (not self.history or self.history[-1] != command.strip()):
-            self.history.append(command.strip())
+        command = command.strip()
+        if command and (not self.history or self.history[-1] != command):
+            self.history.append(command)
             self.current_index = len(self.history)
 
     def get_previous(self) -> Optional[str]:
@@ -53,6 +54,15 @@ class CommandHistory:
         """Reset navigation to the end of history."""
         self.current_index = len(self.history)
 
+    def __len__(self) -> int:
+        """
+        Get the number of commands in history without copying it.
+
+        Returns:
+            int: Number of stored commands
+        """
+        return len(self.history)
+
     def get_history(self) -> List[str]:
         """
         Get the complete command history.